@@ -10,6 +10,25 @@ class CodeLanguage(Enum):
     C11 = "C11"
     CPP17 = "CPP17"
 
+    @staticmethod
+    def from_value(value: str) -> "CodeLanguage":
+        """
+        문자열 값을 CodeLanguage로 변환.
+        Enum 생성자(CodeLanguage(value))를 거치지 않고 미리 만들어 둔 dict에서 바로 조회하며,
+        소문자 값("java17" 등)도 허용한다.
+        """
+        code_language = _CODE_LANGUAGE_BY_VALUE.get(value)
+        if code_language is None:
+            code_language = _CODE_LANGUAGE_BY_LOWER_VALUE.get(value.lower())
+            if code_language is None:
+                raise ValueError(f"'{value}' is not a valid CodeLanguage")
+        return code_language
+
+
+# CodeLanguage.from_value 조회용 매핑 (Enum 클래스 본문에 선언하면 멤버로 취급되므로 모듈 레벨에 선언)
+_CODE_LANGUAGE_BY_VALUE = {member.value: member for member in CodeLanguage}
+_CODE_LANGUAGE_BY_LOWER_VALUE = {member.value.lower(): member for member in CodeLanguage}
+
 
 class FailureCause(Enum):
     """채점 미통과 원인을 나타내는 열거형"""
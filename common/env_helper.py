@@ -1,11 +1,22 @@
+from functools import lru_cache
 import os
 
 
-def get_env_var(key: str, cast_func=lambda x: x):
-    value = os.getenv(key)
-    if value is None:
-        raise ValueError(f"Environment variable '{key}' is not set.")
+@lru_cache(maxsize=None)
+def _read_env_var(key: str) -> str:
+    # 설정되지 않은 키는 KeyError가 발생하여 캐싱되지 않으므로, 이후 호출 시 다시 조회
+    return os.environ[key]
+
+
+def get_env_var(key: str, cast_func=None):
+    try:
+        value = _read_env_var(key)
+    except KeyError:
+        raise ValueError(f"Environment variable '{key}' is not set.") from None
+
+    if cast_func is None:
+        return value
     try:
         return cast_func(value)
     except Exception as e:
-        raise ValueError(f"Error converting environment variable '{key}': {e}") from e
\ No newline at end of file
+        raise ValueError(f"Error converting environment variable '{key}': {e}") from e
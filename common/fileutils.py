@@ -1,15 +1,28 @@
+from functools import lru_cache
 import os
 import json
 
 
 def load_json_file(file_path: str):
+    # 같은 파일을 서로 다른 경로 표현으로 요청하더라도 하나의 캐시 항목을 사용하도록 실제 경로로 정규화
+    # (상대 경로는 common 디렉터리가 아닌 현재 작업 디렉터리 기준으로 해석)
+    return _load_json_file(os.path.realpath(file_path))
+
+
+def clear_json_file_cache():
+    """load_json_file 캐시 초기화 (테스트 등에서 JSON 파일을 다시 읽어야 할 때 사용)"""
+    _load_json_file.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _load_json_file(file_path: str):
     try:
-        with open(os.path.join(os.path.dirname(__file__), file_path), 'r', encoding='utf-8') as f:
+        # 프로세스당 한 번만 로드 후 캐싱되므로 속도보다 정확성 우선
+        # (orjson은 64비트를 초과하는 정수를 float으로 변환하므로 채점 데이터가 손상될 수 있음 -> 표준 json 사용)
+        with open(file_path, 'r', encoding='utf-8') as f:
             json_dict = json.load(f)
     except FileNotFoundError:
         raise FileNotFoundError(f"JSON file not found: {file_path}")
     except json.JSONDecodeError:
         raise ValueError(f"Invalid JSON format in file: {file_path}")
     return json_dict
-
-
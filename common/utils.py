@@ -1,11 +1,19 @@
+from functools import lru_cache
 import re
 
 
+# camel_to_snake 호출마다 패턴을 조회하지 않도록 모듈 로드 시점에 미리 컴파일
+_CAMEL_RE1 = re.compile(r'(.)([A-Z][a-z]+)')
+_CAMEL_RE2 = re.compile(r'([a-z0-9])([A-Z])')
+
+
+# Schema 필드명처럼 입력 값의 종류가 한정된 순수 함수이므로 변환 결과를 캐싱
+@lru_cache(maxsize=1024)
 def snake_to_camel(snake_str: str) -> str:
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+@lru_cache(maxsize=1024)
 def camel_to_snake(camel_str: str) -> str:
-    s1 = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', camel_str)
-    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    return _CAMEL_RE2.sub(r'\1_\2', _CAMEL_RE1.sub(r'\1_\2', camel_str)).lower()
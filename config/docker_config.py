@@ -1,4 +1,5 @@
 import os
+import shutil
 
 from common import get_env_var
 from common.enums import CodeLanguage
@@ -9,23 +10,18 @@ class DockerConfig:
     Description:
         Docker 설정 정보를 관리하는 클래스.
     """
-    _SANDBOX_IMAGE_NAME = {
-        CodeLanguage.JAVA17: get_env_var("SANDBOX_IMAGE_JAVA17"),
-        CodeLanguage.NODEJS20: get_env_var("SANDBOX_IMAGE_NODEJS20"),
-        CodeLanguage.NODEJS20ESM: get_env_var("SANDBOX_IMAGE_NODEJS20ESM"),
-        CodeLanguage.PYTHON3: get_env_var("SANDBOX_IMAGE_PYTHON3"),
-        CodeLanguage.C11: get_env_var("SANDBOX_IMAGE_CLANG15"),
-        CodeLanguage.CPP17: get_env_var("SANDBOX_IMAGE_CLANG15")
+    # 언어별 (샌드박스 이미지 이름, 채점 스크립트 경로)를 한 번의 조회로 반환할 수 있도록 튜플로 저장
+    _SANDBOX_IMAGE_NAME_AND_SCRIPT_PATH = {
+        CodeLanguage.JAVA17: (get_env_var("SANDBOX_IMAGE_JAVA17"), get_env_var("SANDBOX_SCRIPT_PATH_JAVA17")),
+        CodeLanguage.NODEJS20: (get_env_var("SANDBOX_IMAGE_NODEJS20"), get_env_var("SANDBOX_SCRIPT_PATH_NODEJS20")),
+        CodeLanguage.NODEJS20ESM: (get_env_var("SANDBOX_IMAGE_NODEJS20ESM"), get_env_var("SANDBOX_SCRIPT_PATH_NODEJS20ESM")),
+        CodeLanguage.PYTHON3: (get_env_var("SANDBOX_IMAGE_PYTHON3"), get_env_var("SANDBOX_SCRIPT_PATH_PYTHON3")),
+        CodeLanguage.C11: (get_env_var("SANDBOX_IMAGE_CLANG15"), get_env_var("SANDBOX_SCRIPT_PATH_C11")),
+        CodeLanguage.CPP17: (get_env_var("SANDBOX_IMAGE_CLANG15"), get_env_var("SANDBOX_SCRIPT_PATH_CPP17"))
     }
 
-    _SANDBOX_SCRIPT_PATH = {
-        CodeLanguage.JAVA17: get_env_var("SANDBOX_SCRIPT_PATH_JAVA17"),
-        CodeLanguage.NODEJS20: get_env_var("SANDBOX_SCRIPT_PATH_NODEJS20"),
-        CodeLanguage.NODEJS20ESM: get_env_var("SANDBOX_SCRIPT_PATH_NODEJS20ESM"),
-        CodeLanguage.PYTHON3: get_env_var("SANDBOX_SCRIPT_PATH_PYTHON3"),
-        CodeLanguage.C11: get_env_var("SANDBOX_SCRIPT_PATH_C11"),
-        CodeLanguage.CPP17: get_env_var("SANDBOX_SCRIPT_PATH_CPP17")
-    }
+    # 채점마다 실행 시점에 PATH를 탐색하지 않도록 docker 실행 파일의 절대 경로를 한 번만 조회 (찾지 못한 경우 이름 그대로 사용)
+    _DOCKER_BINARY_PATH = shutil.which("docker") or "docker"
 
     _SECCOMP_PROFILE_PATH = os.path.join(os.path.dirname(__file__), "json", "seccomp-profile.json")
 
@@ -40,7 +36,11 @@ class DockerConfig:
 
     @staticmethod
     def get_sandbox_image_name_and_script_path(code_language: CodeLanguage) -> tuple[str, str]:
-        return DockerConfig._SANDBOX_IMAGE_NAME[code_language], DockerConfig._SANDBOX_SCRIPT_PATH[code_language]
+        return DockerConfig._SANDBOX_IMAGE_NAME_AND_SCRIPT_PATH[code_language]
+
+    @staticmethod
+    def get_docker_binary_path() -> str:
+        return DockerConfig._DOCKER_BINARY_PATH
 
     @staticmethod
     def get_seccomp_profile_path() -> str:
@@ -11,3 +11,7 @@ class RedisConfig:
     PASSWORD = get_env_var("REDIS_PASSWORD")
     DB = get_env_var("REDIS_DB", int)
     REDIS_URI = f'redis://:{PASSWORD}@{HOST}:{PORT}/{DB}'
+
+    # 커넥션 풀 최대 연결 수 및 풀이 가득 찬 경우 연결 반환을 기다리는 최대 시간(초)
+    MAX_CONNECTIONS = 32
+    POOL_TIMEOUT = 5
@@ -4,26 +4,59 @@ from common.enums import CodeLanguage
 from common.fileutils import load_json_file
 
 
+_JSON_DIR = os.path.join(os.path.dirname(__file__), "json")
+
+
 class TestCaseConfig:
-    _TEST_CASES = load_json_file(os.path.join(os.path.dirname(__file__), "json", "test_cases_inputs_and_expected.json"))
+    """
+    Description:
+        테스트 케이스 및 실행 시간/메모리 제한 정보를 관리하는 클래스.
+        JSON 파일은 config 패키지 import 시점이 아닌 preload() 호출 또는 최초 조회 시점에 로드한다.
+    """
+    _loaded = False
+
+    _TEST_CASES = None
 
-    _TEST_CASES_LIMITS = load_json_file(os.path.join(os.path.dirname(__file__), "json", "exec_time_and_memory_limits.json"))
-    _TEST_CASES_TIME_LIMITS = _TEST_CASES_LIMITS.get("timeLimits")
-    _TEST_CASES_MEM_LIMITS = _TEST_CASES_LIMITS.get("memoryLimits")
+    _TEST_CASES_TIME_LIMITS = None
+    _TEST_CASES_MEM_LIMITS = None
+
+    _TEST_CASE_LIMITS_TIME_BONUS = None
+    _TEST_CASE_LIMITS_MEMORY_BONUS = None
+
+    @staticmethod
+    def _load():
+        if TestCaseConfig._loaded:
+            return
 
-    _TEST_CASE_LIMITS_BONUS = load_json_file(os.path.join(os.path.dirname(__file__), "json", "exec_time_and_memory_language_bonus.json"))
-    _TEST_CASE_LIMITS_TIME_BONUS = _TEST_CASE_LIMITS_BONUS.get("timeBonus")
-    _TEST_CASE_LIMITS_MEMORY_BONUS = _TEST_CASE_LIMITS_BONUS.get("memoryBonus")
+        TestCaseConfig._TEST_CASES = load_json_file(os.path.join(_JSON_DIR, "test_cases_inputs_and_expected.json"))
+
+        test_cases_limits = load_json_file(os.path.join(_JSON_DIR, "exec_time_and_memory_limits.json"))
+        TestCaseConfig._TEST_CASES_TIME_LIMITS = test_cases_limits.get("timeLimits")
+        TestCaseConfig._TEST_CASES_MEM_LIMITS = test_cases_limits.get("memoryLimits")
+
+        test_case_limits_bonus = load_json_file(os.path.join(_JSON_DIR, "exec_time_and_memory_language_bonus.json"))
+        TestCaseConfig._TEST_CASE_LIMITS_TIME_BONUS = test_case_limits_bonus.get("timeBonus")
+        TestCaseConfig._TEST_CASE_LIMITS_MEMORY_BONUS = test_case_limits_bonus.get("memoryBonus")
+
+        TestCaseConfig._loaded = True
+
+    @staticmethod
+    def preload():
+        """테스트 케이스 JSON 파일을 즉시 로드 (파일이 없거나 잘못된 경우 호출 시점에 예외 발생)"""
+        TestCaseConfig._load()
 
     @staticmethod
     def get_test_cases(challenge_id: int) -> list:
+        TestCaseConfig._load()
         return TestCaseConfig._TEST_CASES[str(challenge_id)]
 
     @staticmethod
     def get_memory_limit(challenge_id: int, code_language: CodeLanguage) -> int:
+        TestCaseConfig._load()
         return TestCaseConfig._TEST_CASES_MEM_LIMITS[str(challenge_id)] + TestCaseConfig._TEST_CASE_LIMITS_MEMORY_BONUS[code_language.value]
 
     @staticmethod
     def get_time_limit(challenge_id: int, code_language: CodeLanguage) -> float:
+        TestCaseConfig._load()
         return TestCaseConfig._TEST_CASES_TIME_LIMITS[str(challenge_id)] + TestCaseConfig._TEST_CASE_LIMITS_TIME_BONUS[code_language.value]
 
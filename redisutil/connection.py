@@ -7,29 +7,37 @@ class RedisConnection:
     """
     Description:
         Redis 설정 Client 객체를 제공하는 클래스.
-        DI(의존성 주입) 방식으로, 외부에서 Redis 연결에 필요한 설정(host, port, password, db)을 주입받아 인스턴스를 생성.
+        DI(의존성 주입) 방식으로, 외부에서 Redis 연결에 필요한 설정(host, port, password, db, 커넥션 풀 크기, 풀 대기 시간)을 주입받아 인스턴스를 생성.
     """
 
-    def __init__(self, host, port, password, db):
+    def __init__(self, host, port, password, db, max_connections, pool_timeout):
         self._host = host
         self._port = port
         self._password = password
         self._db = db
+        self._max_connections = max_connections
+        self._pool_timeout = pool_timeout
         self._client = None
         self._connect()
 
     def _connect(self):
         """
         Description:
-            job.StrictRedis 객체 생성 및 client 필드 초기화 & ping 테스트
+            커넥션 풀 기반 job.StrictRedis 객체 생성 및 client 필드 초기화 & ping 테스트
         """
         try:
-            client = redis.StrictRedis(
+            # 커넥션 풀을 통해 소켓을 재사용하고, decode_responses=True로 응답을 str로 디코딩하여 반환
+            # 풀이 가득 찬 경우 즉시 ConnectionError를 발생시키지 않고 pool_timeout(초)까지 연결 반환을 대기
+            pool = redis.BlockingConnectionPool(
                 host=self._host,
                 port=self._port,
                 password=self._password,
-                db=self._db
+                db=self._db,
+                decode_responses=True,
+                max_connections=self._max_connections,
+                timeout=self._pool_timeout
             )
+            client = redis.StrictRedis(connection_pool=pool)
             # 연결 테스트
             client.ping()
             self._client = client
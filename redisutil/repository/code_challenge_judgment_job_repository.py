@@ -1,8 +1,9 @@
-import json
-from typing import Optional, Union
+from typing import Optional
 import logging
 import time
 
+import orjson
+
 from redisutil import RedisConnection, RedisConnectionError
 from schema import Verdict
 from schema.job import CodeChallengeJudgmentJob as Job
@@ -13,43 +14,42 @@ class CodeChallengeJudgmentJobRepository:
     코딩 테스트 작업(Job) 정보를 Redis에 CRUD하는 메서드를 제공하는 클래스.
     """
 
+    # SCAN 1회당 서버가 검사할 키 개수 힌트 (기본값 10은 키 공간이 클수록 왕복 횟수가 크게 늘어남)
+    _SCAN_COUNT = 500
+
     def __init__(self, redis_conn: RedisConnection):
         self._redis_client = redis_conn.client
 
 
     def find_by_user_id(self, user_id: int) -> list[Job]:
         key_pattern = f"{user_id}:*"
-        # Redis 조회는 기본적으로 str 반환, Redis encode/decode 관련 설정에 따라 bytes 타입이 반환될 수 있음
-        keys: list[Union[str, bytes]] = list(self._with_retry(
-            self._redis_client.scan_iter, key_pattern
+        keys: list[str] = list(self._with_retry(
+            self._redis_client.scan_iter, match=key_pattern, count=self._SCAN_COUNT
         ))
 
-        jobs: list[Job] = []
-        for key in keys:
-            job_data: Union[str, bytes, None] = self._with_retry(
-                self._redis_client.get, key
-            )
-            if job_data:
-                if isinstance(job_data, bytes):
-                    job_data = job_data.decode("utf-8") # bytes 타입인 경우 디코딩하여 str 타입으로 변환
-                jobs.append(Job.create_from_dict(json.loads(job_data)))
-        return jobs
+        if not keys:
+            return []
+
+        # 키마다 GET을 반복하지 않고 MGET 한 번(1 RTT)으로 모든 작업 데이터 조회
+        job_data_list: list[Optional[str]] = self._with_retry(
+            self._redis_client.mget, keys
+        )
+
+        # 조회 사이에 TTL 만료된 키는 None 반환되므로 제외
+        return [Job.create_from_dict(orjson.loads(job_data)) for job_data in job_data_list if job_data]
 
 
     def find_user_id_by_job_id(self, job_id: str) -> int:
         key_pattern = f"*:{job_id}"
 
-        key: Union[str, bytes, None] = self._with_retry(
+        key: Optional[str] = self._with_retry(
             # next(iterator, default_value)를 사용하여 첫 번째 값만 가져오고 반복 중단
-            lambda _key_pattern: next(self._redis_client.scan_iter(_key_pattern), None), key_pattern
+            lambda _key_pattern: next(self._redis_client.scan_iter(match=_key_pattern, count=self._SCAN_COUNT), None), key_pattern
         )
 
         if not key:
             return -1
 
-        if isinstance(key, bytes):
-            key = key.decode("utf-8")
-
         user_id_str = key.split(":", 1)[0] # 1회만 분할하여 리스트로 구분 후 0번 요소 추출
         return int(user_id_str)
 
@@ -66,14 +66,12 @@ class CodeChallengeJudgmentJobRepository:
         key = f"{user_id}:{job_id}"
 
         job = None
-        # get 반환 값 -> value 존재: str/bytes, value 존재 X: None
-        job_data: [str, bytes, None] = self._with_retry(
+        # get 반환 값 -> value 존재: str (decode_responses=True), value 존재 X: None
+        job_data: Optional[str] = self._with_retry(
             self._redis_client.get, key
         )
         if job_data:
-            if isinstance(job_data, bytes):
-                job_data = job_data.decode("utf-8") # bytes 타입인 경우 디코딩하여 str 타입으로 변환
-            job = Job.create_from_dict(json.loads(job_data))
+            job = Job.create_from_dict(orjson.loads(job_data))
         return job
 
 
@@ -85,7 +83,7 @@ class CodeChallengeJudgmentJobRepository:
         key = f"{user_id}:{job.job_id}"
 
         return 1 if self._with_retry(
-            self._redis_client.setex, key, ttl, json.dumps(job.as_dict())
+            self._redis_client.setex, key, ttl, orjson.dumps(job.as_dict())
         ) else 0
 
 
@@ -117,31 +115,40 @@ class CodeChallengeJudgmentJobRepository:
             if user_id == -1:
                 return -1
 
-        job = self.find_by_user_id_and_job_id(user_id, job_id)
-
         key = f"{user_id}:{job_id}"
-        if not job:
-            return -1
 
-        # 기존 키의 TTL 조회
-        ttl_value = self._with_retry(
-            self._redis_client.ttl, key
-        )
+        def _update_job(pipe) -> int:
+            # WATCH 상태에서 조회하므로, 조회 이후 다른 클라이언트가 키를 변경하면 EXEC 시 WatchError 발생 -> transaction()이 처음부터 재실행
+            job_data: Optional[str] = pipe.get(key)
+            if not job_data:
+                return -1
 
-        if ttl_value < 0:
-            # -1 => ttl 설정되지 않은 상태 (로직 상 존재 불가능)
-            # -2 => key가 존재하지 않음
-            if ttl_value == -1:
-                self.delete(job_id, user_id)
-            return -1
+            # 기존 키의 TTL 조회
+            pttl: int = pipe.pttl(key)
+            if pttl < 0:
+                # -1 => ttl 설정되지 않은 상태 (로직 상 존재 불가능)
+                # -2 => key가 존재하지 않음
+                if pttl == -1:
+                    pipe.multi()
+                    pipe.delete(key)
+                return -1
 
-        if stop_flag is not None:
-            job.stop_flag = stop_flag
+            job = Job.create_from_dict(orjson.loads(job_data))
+            if stop_flag is not None:
+                job.stop_flag = stop_flag
 
-        if verdicts is not None:
-            job.verdicts = verdicts
+            if verdicts is not None:
+                job.verdicts = verdicts
 
-        return self.save(user_id, job, ttl_value)
+            # 작업 문서 전체를 다른 서비스와 같은 방식(orjson, as_dict)으로 직렬화하고 남은 TTL을 유지한 채 저장
+            pipe.multi()
+            pipe.set(key, orjson.dumps(job.as_dict()), px=pttl)
+            return 1
+
+        # 작업 조회/TTL 조회/저장 사이에 키가 변경되거나 만료되지 않도록 WATCH/MULTI 트랜잭션으로 처리
+        return self._with_retry(
+            self._redis_client.transaction, _update_job, key, value_from_callable=True
+        )
 
 
     # 필드에 의존하지 않는 메서드 이므로 static으로 처리
@@ -156,19 +163,27 @@ class CodeChallengeJudgmentJobRepository:
         - args, kwargs: 함수에 전달될 인자
         """
 
+        # 대부분의 호출은 첫 시도에 성공하므로, 재시도 관련 처리는 첫 실패 이후에만 수행
+        try:
+            return func(*args, **kwargs)
+        except Exception as ex:
+            first_exception = ex
+
         max_retries = 3 # 최대 재시도 횟수
         retry_interval = 0.5 # 재시도 간격 (단위: 초)
-        for attempt in range(1, max_retries + 1):
+        func_name = getattr(func, '__name__', repr(func))
+        # 로그 레벨에 따라 출력되지 않는 경우 문자열을 만들지 않도록 %-포맷팅 사용
+        log_format = "[(Attempt: (%d/%d) JobRepository >> %s throw unexpected exception: %s]"
+
+        logging.error(log_format, 1, max_retries, func_name, first_exception)
+        for attempt in range(2, max_retries + 1):
+            time.sleep(retry_interval)
+            retry_interval *= 2
             try:
                 return func(*args, **kwargs)
             except Exception as ex:
-                func_name = getattr(func, '__name__', repr(func))
-                logging.error(
-                    f"[(Attempt: ({attempt}/{max_retries}) JobRepository >> {func_name} throw unexpected exception: {ex}]")
-                if attempt < max_retries:
-                    time.sleep(retry_interval)
-                    retry_interval *= 2
-                else:
+                logging.error(log_format, attempt, max_retries, func_name, ex)
+                if attempt == max_retries:
                     raise  # 최종 실패 시 func에서 발생한 예외를 그대로 throw -> 상위에서 처리
 
 
@@ -179,7 +194,9 @@ try:
             host=RedisConfig.HOST,
             port=RedisConfig.PORT,
             password=RedisConfig.PASSWORD,
-            db=RedisConfig.DB
+            db=RedisConfig.DB,
+            max_connections=RedisConfig.MAX_CONNECTIONS,
+            pool_timeout=RedisConfig.POOL_TIMEOUT
         )
     )
 except RedisConnectionError as ex:
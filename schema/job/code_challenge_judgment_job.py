@@ -1,13 +1,16 @@
 import datetime
 from dataclasses import dataclass
-import pytz
 import uuid
 
 from common import CodeLanguage, FailureCause
 from schema import Schema, Verdict
 
 
-@dataclass
+# KST는 서머타임이 없는 고정 오프셋(UTC+9)이므로 pytz 조회 없이 모듈 로드 시 한 번만 생성
+_KST = datetime.timezone(datetime.timedelta(hours=9))
+
+
+@dataclass(slots=True)
 class CodeChallengeJudgmentJob(Schema):
     """
     Description:
@@ -43,8 +46,12 @@ class CodeChallengeJudgmentJob(Schema):
 
     def __post_init__(self):
         """객체 초기화 후 code_language를 문자열에서 CodeLanguage 객체로 변환"""
-        if isinstance(self.code_language, str):
-            self.failure_cause = CodeLanguage(self.code_language)
+        code_language = self.code_language
+        # create 팩토리 메서드 등에서 이미 CodeLanguage로 전달된 경우 변환 생략
+        if type(code_language) is CodeLanguage:
+            return
+        if isinstance(code_language, str):
+            self.code_language = CodeLanguage.from_value(code_language)
 
     @staticmethod
     def create(
@@ -68,8 +75,8 @@ class CodeChallengeJudgmentJob(Schema):
         Returns:
             CodeChallengeJudgmentJobEntity: 생성된 평가 작업 엔티티
         """
-        seoul_tz = pytz.timezone('Asia/Seoul')
-        now_in_seoul = datetime.datetime.now(seoul_tz)
+        # 기존 형식('%Y-%m-%dT%H:%M:%S')과 동일하게 오프셋 없이 초 단위까지만 출력되도록 tzinfo 제거 후 isoformat 사용
+        now_in_seoul = datetime.datetime.now(_KST).replace(tzinfo=None)
         return CodeChallengeJudgmentJob(
             job_id=str(uuid.uuid4()),
             stop_flag=False,
@@ -81,31 +88,9 @@ class CodeChallengeJudgmentJob(Schema):
             total_test_cases=total_test_cases,
             verdicts=[],
 
-            submitted_at=now_in_seoul.strftime('%Y-%m-%dT%H:%M:%S')
+            submitted_at=now_in_seoul.isoformat(timespec='seconds')
         )
 
-    @classmethod
-    def create_from_dict(cls, judgment_job_dict: dict) -> "CodeChallengeJudgmentJob":
-        """
-        Description:
-            부모 클래스 Schema의 create_from_dict를 호출한 뒤,
-            code_language 필드를 CodeLanguage 객체로 변환하여 인스턴스를 생성합니다.
-
-        Args:
-            judgment_job_dict (dict): 입력 딕셔너리
-
-        Returns:
-            CodeChallengeJudgmentJob: 생성된 인스턴스
-        """
-        # 부모 클래스 Schema의 create_from_dict 호출
-        instance = super().create_from_dict(judgment_job_dict)
-
-        # code_language 변환 (문자열 -> CodeLanguage 객체)
-        if isinstance(instance.code_language, str):
-            instance.code_language = CodeLanguage(instance.code_language)
-
-        return instance
-
 
 # dict -> schema 변환 테스트: dict 필드 검증 및 인스턴스 반환
 if __name__=='__main__':
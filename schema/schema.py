@@ -1,28 +1,127 @@
 from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Union, get_args, get_origin
 
 from common import camel_to_snake, snake_to_camel, CodeLanguage
 
 
+# as_dict에서 필드 값 변환 방식을 구분하기 위한 필드 종류
+_FIELD_KIND_PLAIN = 0  # int, float, str, bool: 변환 없이 그대로 사용
+_FIELD_KIND_ENUM = 1   # Enum: .value 사용
+_FIELD_KIND_OTHER = 2  # Schema, list, dict 등: _process_value로 변환
+
+_PLAIN_FIELD_TYPES = (int, float, str, bool)
+
+
+def _resolve_field_kind(field_type) -> int:
+    """선언된 필드 타입(Optional[X]인 경우 X)으로부터 필드 종류를 결정"""
+    if get_origin(field_type) is Union:
+        non_none_types = [t for t in get_args(field_type) if t is not type(None)]
+        if len(non_none_types) != 1:
+            return _FIELD_KIND_OTHER
+        field_type = non_none_types[0]
+
+    if isinstance(field_type, type):
+        if issubclass(field_type, Enum):
+            return _FIELD_KIND_ENUM
+        if field_type in _PLAIN_FIELD_TYPES:
+            return _FIELD_KIND_PLAIN
+    return _FIELD_KIND_OTHER
+
+
+def _process_enum(value: Enum):
+    return value.value
+
+
+def _process_schema(value: "Schema"):
+    return value.as_dict()
+
+
+def _process_dict(value: dict):
+    return {snake_to_camel(k) if isinstance(k, str) else k:
+                _process_value(v) for k, v in value.items()}
+
+
+def _process_list(value: list):
+    return [_process_value(item) for item in value]
+
+
+def _process_plain(value):
+    return value
+
+
+# 값의 타입 -> 변환 함수 매핑 (처음 보는 타입은 _resolve_value_processor로 결정 후 추가)
+_VALUE_PROCESSORS: dict[type, Callable[[Any], Any]] = {
+    dict: _process_dict,
+    list: _process_list,
+    int: _process_plain,
+    float: _process_plain,
+    str: _process_plain,
+    bool: _process_plain,
+    type(None): _process_plain
+}
+
+
+def _resolve_value_processor(value_type: type) -> Callable[[Any], Any]:
+    """기존 isinstance 검사 순서(Enum -> Schema -> dict -> list)대로 타입별 변환 함수를 결정"""
+    if issubclass(value_type, Enum):
+        return _process_enum
+    elif issubclass(value_type, Schema):
+        return _process_schema
+    elif issubclass(value_type, dict):
+        return _process_dict
+    elif issubclass(value_type, list):
+        return _process_list
+    return _process_plain
+
+
+def _process_value(value):
+    """
+    타입에 따라 값을 변환하는 헬퍼 함수.
+    isinstance 검사를 차례로 수행하지 않고, type(value)로 변환 함수를 한 번에 조회
+    """
+    value_type = type(value)
+    processor = _VALUE_PROCESSORS.get(value_type)
+    if processor is None:
+        processor = _resolve_value_processor(value_type)
+        _VALUE_PROCESSORS[value_type] = processor
+    return processor(value)
+
+
 @dataclass
 class Schema:
+    # 하위 데이터 클래스(slots=True) 인스턴스가 __dict__ 없이 생성되도록 빈 slots 선언
+    __slots__ = ()
+
     @classmethod
-    def validate_keys(cls, schema_dict: dict):
+    def _get_valid_fields(cls) -> frozenset[str]:
         """
-        입력된 딕셔너리의 각 camelCase(또는 snake_case) 키를 snake_case로 변환한 후,
-        해당 클래스의 필드 이름과 모두 일치하는지 확인합니다.
+        클래스별 필드 이름 집합을 반환합니다.
+        호출마다 fields(cls)로 집합을 다시 만들지 않도록 최초 호출 시 클래스에 캐싱합니다.
 
-        (cls 인자를 통해 현재 호출한 클래스를 직접 참조하기 위해 static 대신 @classmethod 사용)
+        (@dataclass 데코레이터는 __init_subclass__ 이후에 적용되므로, 클래스 정의 시점이 아닌 최초 호출 시점에 생성)
+        """
+        # 부모 클래스의 캐시를 상속받아 사용하지 않도록 cls.__dict__에서 직접 조회
+        valid_fields = cls.__dict__.get('_valid_fields')
+        if valid_fields is None:
+            valid_fields = frozenset(f.name for f in fields(cls))
+            cls._valid_fields = valid_fields
+        return valid_fields
+
+    @classmethod
+    def _get_key_map(cls) -> dict[str, str]:
         """
-        valid_fields = {f.name for f in fields(cls)}
-        for key in schema_dict.keys():
-            converted_key = camel_to_snake(key)
-            if converted_key not in valid_fields:
-                raise ValueError(
-                    f"Invalid key in input dict: '{key}' (converted to '{converted_key}') "
-                    f"is not a valid field for {cls.__name__}"
-                )
+        클래스별 입력 키(camelCase, snake_case) -> 필드 이름 매핑을 반환합니다.
+        일반적인 입력 키는 정규식 변환 없이 dict 조회 한 번으로 필드 이름을 찾을 수 있도록 최초 호출 시 클래스에 캐싱합니다.
+        """
+        key_map = cls.__dict__.get('_key_map')
+        if key_map is None:
+            key_map = {}
+            for field_name in cls._get_valid_fields():
+                key_map[field_name] = field_name
+                key_map[snake_to_camel(field_name)] = field_name
+            cls._key_map = key_map
+        return key_map
 
     @classmethod
     def create_from_dict(cls, schema_dict: dict) -> "Schema":
@@ -30,16 +129,44 @@ class Schema:
         부모 클래스에서 전체 구현을 제공하여, 입력 딕셔너리의
         camelCase 또는 snake_case 키를 모두 snake_case로 변환한 뒤,
         해당 클래스의 생성자에 전달하여 인스턴스를 생성합니다.
+        변환된 키가 해당 클래스의 필드 이름과 일치하지 않으면 ValueError를 발생시킵니다.
 
         (cls 인자를 통해 현재 호출한 클래스를 직접 참조하기 위해 static 대신 @classmethod 사용)
         """
-        cls.validate_keys(schema_dict)
-        processed_dict = {camel_to_snake(key): value for key, value in schema_dict.items()}
+        key_map = cls._get_key_map()
+
+        # 키 검증과 snake_case 변환을 한 번의 순회로 처리
+        processed_dict = {}
+        for key, value in schema_dict.items():
+            field_name = key_map.get(key)
+            if field_name is None:
+                # 매핑에 없는 키만 기존 방식대로 변환 후 검증
+                field_name = camel_to_snake(key)
+                if field_name not in cls._get_valid_fields():
+                    raise ValueError(
+                        f"Invalid key in input dict: '{key}' (converted to '{field_name}') "
+                        f"is not a valid field for {cls.__name__}"
+                    )
+            processed_dict[field_name] = value
 
         # 동적 필드를 넘기는 부분을 정확히 추론하지 못해서 발생하는 IDE의 경고는
-        # 이미 입력 값을 validate_keys를 통해 검증 하였기 때문에 무시
+        # 이미 입력 값을 검증 하였기 때문에 무시
         return cls(**processed_dict)
 
+    @classmethod
+    def _get_serialize_fields(cls) -> tuple[tuple[str, str, int], ...]:
+        """
+        클래스별 (필드 이름, camelCase 키, 필드 종류) 목록을 반환합니다.
+        as_dict 호출마다 fields() 조회, 키 변환, 타입 검사를 반복하지 않도록 최초 호출 시 클래스에 캐싱합니다.
+        """
+        serialize_fields = cls.__dict__.get('_serialize_fields')
+        if serialize_fields is None:
+            serialize_fields = tuple(
+                (f.name, snake_to_camel(f.name), _resolve_field_kind(f.type)) for f in fields(cls)
+            )
+            cls._serialize_fields = serialize_fields
+        return serialize_fields
+
     def as_dict(self) -> dict[str, Any]:
         """
         객체를 사전(dict)로 변환합니다.
@@ -47,27 +174,15 @@ class Schema:
         Enum 타입의 값은 .value를 사용하여 직렬화하며,
         중첩된 Schema 객체에 대해서는 재귀적 as_dict 변환을 수행합니다.
         """
-        # 각 필드 순회하며 직접 처리
+        # 캐싱된 필드 목록을 순회하며, 선언된 타입에 따라 필요한 경우에만 값 변환
         result = {}
-
-        for f in fields(self):
-            value = getattr(self, f.name)
-            # 값 처리
-            processed_value = self._process_value(value)
-            # 키 변환 및 결과 저장
-            result[snake_to_camel(f.name)] = processed_value
-
+        for field_name, camel_key, field_kind in self._get_serialize_fields():
+            value = getattr(self, field_name)
+            if field_kind == _FIELD_KIND_PLAIN or value is None:
+                result[camel_key] = value
+            elif field_kind == _FIELD_KIND_ENUM:
+                # __post_init__에서 변환되지 않은 문자열 값은 그대로 사용
+                result[camel_key] = value.value if isinstance(value, Enum) else value
+            else:
+                result[camel_key] = _process_value(value)
         return result
-
-    def _process_value(self, value):
-        """타입에 따라 값을 변환하는 헬퍼 메서드"""
-        if isinstance(value, Enum):
-            return value.value
-        elif isinstance(value, Schema):
-            return value.as_dict()
-        elif isinstance(value, dict):
-            return {snake_to_camel(k) if isinstance(k, str) else k:
-                        self._process_value(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [self._process_value(item) for item in value]
-        return value
\ No newline at end of file
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from schema import Schema
 
 
-@dataclass
+@dataclass(slots=True)
 class Error(Schema):
     job_id: str
     error: str = "Internal server error"
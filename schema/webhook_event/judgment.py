@@ -5,7 +5,7 @@ from schema import Schema, Verdict
 from common import CodeLanguage, FailureCause
 
 
-@dataclass
+@dataclass(slots=True)
 class Judgment(Schema):
     """코드 채점의 최종 결과를 나타내는 기반 데이터 클래스 (DB 저장용)"""
     user_id: int
@@ -19,70 +19,37 @@ class Judgment(Schema):
 
     def __post_init__(self):
         """객체 초기화 후 code_language를 문자열에서 CodeLanguage 객체로 변환"""
-        if isinstance(self.code_language, str):
-            self.failure_cause = CodeLanguage(self.code_language)
+        code_language = self.code_language
+        # create_judgment_from_verdicts 등에서 이미 CodeLanguage로 전달된 경우 변환 생략
+        if type(code_language) is CodeLanguage:
+            return
+        if isinstance(code_language, str):
+            self.code_language = CodeLanguage.from_value(code_language)
 
-    @classmethod
-    def create_from_dict(cls, judgment_dict: dict) -> "Judgment":
-        """
-        Description:
-            부모 클래스 Schema의 create_from_dict를 호출한 뒤,
-            code_language 필드를 CodeLanguage 객체로 변환하여 인스턴스를 생성합니다.
 
-        Args:
-            judgment_dict (dict): 입력 딕셔너리
-
-        Returns:
-            Judgment: 생성된 인스턴스
-        """
-        # 부모 클래스 Schema의 create_from_dict 호출
-        instance = super().create_from_dict(judgment_dict)
-
-        # code_language 변환 (문자열 -> CodeLanguage 객체)
-        if isinstance(instance.code_language, str):
-            instance.code_language = CodeLanguage(instance.code_language)
-
-        return instance
-
-
-@dataclass
+@dataclass(slots=True)
 class PassedJudgment(Judgment):
     """모든 테스트 케이스가 통과한 채점 결과"""
     max_memory_usage_mb: float
     max_elapsed_time_ms: int
 
-@dataclass
+@dataclass(slots=True)
 class UnpassedJudgment(Judgment):
     """하나 이상의 테스트 케이스가 실패하거나 컴파일/런타임 에러가 발생한 채점 결과"""
     failure_cause: FailureCause
     failure_detail: Optional[str] = None
 
     def __post_init__(self):
-        """객체 초기화 후 failure_cause를 문자열에서 FailureCause 객체로 변환"""
-        if isinstance(self.failure_cause, str):
-            self.failure_cause = FailureCause(self.failure_cause)
-
-    @classmethod
-    def create_from_dict(cls, unpassed_judgment_dict: dict) -> "UnpassedJudgment":
-        """
-        Description:
-            부모 클래스 Judgment의 create_from_dict를 호출한 뒤,
-            failure_cause 필드를 FailureCause 객체로 변환하여 인스턴스를 생성합니다.
+        """객체 초기화 후 code_language, failure_cause를 문자열에서 각 Enum 객체로 변환"""
+        # slots 데이터 클래스에서는 인자 없는 super()를 사용할 수 없으므로 부모 메서드를 직접 호출
+        Judgment.__post_init__(self)
+        failure_cause = self.failure_cause
+        # 이미 FailureCause이거나 값이 없는 경우는 변환 생략
+        if failure_cause is None or type(failure_cause) is FailureCause:
+            return
+        if isinstance(failure_cause, str):
+            self.failure_cause = FailureCause(failure_cause)
 
-        Args:
-            unpassed_judgment_dict (dict): 입력 딕셔너리
-
-        Returns:
-            UnpassedJudgment: 생성된 인스턴스
-        """
-        # 부모 클래스 Judgment의 create_from_dict 호출
-        instance = super().create_from_dict(unpassed_judgment_dict)
-
-        # failure_cause 변환 (문자열 -> FailureCause 객체)
-        if isinstance(instance.failure_cause, str):
-            instance.failure_cause = FailureCause(instance.failure_cause)
-
-        return instance
 
 def create_judgment_from_verdicts(
     verdicts: list[Verdict],
@@ -105,18 +72,6 @@ def create_judgment_from_verdicts(
     Returns:
         Judgment: PassedJudgment 또는 UnpassedJudgment 인스턴스.
     """
-    # 공통 필드 준비
-    base_kwargs = {
-        "user_id": user_id,
-        "job_id": job_id,
-        "challenge_id": challenge_id,
-        "passed": True,
-        "code_language": code_language,
-        "code": code,
-        "code_byte_size": code_byte_size,
-        "submitted_at": submitted_at
-    }
-
     # 최대 메모리 사용량,
     max_memory_usage_mb = 0.0
     max_elapsed_time_ms = 0
@@ -128,22 +83,42 @@ def create_judgment_from_verdicts(
                     f"Invalid Verdict: Failure verdict at test case {verdict.test_case_index} has no failure cause."
                 )
 
-            base_kwargs.update({"passed": False})
+            # 공통 필드를 dict로 만들어 펼치지 않고 키워드 인자로 직접 전달
             return UnpassedJudgment(
-                **base_kwargs,
+                user_id=user_id,
+                job_id=job_id,
+                challenge_id=challenge_id,
+                passed=False,
+                code_language=code_language,
+                code=code,
+                code_byte_size=code_byte_size,
+                submitted_at=submitted_at,
                 failure_cause=verdict.failure_cause,
                 failure_detail=verdict.failure_detail
             )
 
-        if verdict.memory_usage_mb is None or verdict.elapsed_time_ms is None:
+        # 속성 조회를 한 번씩만 하도록 지역 변수에 바인딩
+        memory_usage_mb = verdict.memory_usage_mb
+        elapsed_time_ms = verdict.elapsed_time_ms
+        if memory_usage_mb is None or elapsed_time_ms is None:
             raise ValueError(
                 "Invalid Verdict: All verdicts must provide memory_usage_mb and elapsed_time_ms for PassedJudgment."
             )
-        max_memory_usage_mb = max(max_memory_usage_mb, verdict.memory_usage_mb)
-        max_elapsed_time_ms = max(max_elapsed_time_ms, verdict.elapsed_time_ms)
+        # 내장 함수 max() 호출 대신 직접 비교
+        if memory_usage_mb > max_memory_usage_mb:
+            max_memory_usage_mb = memory_usage_mb
+        if elapsed_time_ms > max_elapsed_time_ms:
+            max_elapsed_time_ms = elapsed_time_ms
 
     return PassedJudgment(
-        **base_kwargs,
+        user_id=user_id,
+        job_id=job_id,
+        challenge_id=challenge_id,
+        passed=True,
+        code_language=code_language,
+        code=code,
+        code_byte_size=code_byte_size,
+        submitted_at=submitted_at,
         max_memory_usage_mb=max_memory_usage_mb,
         max_elapsed_time_ms=max_elapsed_time_ms
     )
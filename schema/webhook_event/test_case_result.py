@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from schema import Schema, Verdict
 
 
-@dataclass
+@dataclass(slots=True)
 class TestCaseResult(Schema):
     job_id: str
     verdict: Verdict
@@ -1,11 +1,14 @@
 import asyncio # 비동기 작업을 처리하기 위한 파이썬 기본 라이브러리입니다. async와 await를 키워드를 통한 코루틴 작업을 통해 여러 작업을 동시에 실행할 수 있게 해줍니다.
 import base64
+import functools
 import json
 import os
 import random
 import tempfile
 import logging
 
+import orjson
+
 from config import DockerConfig, TestCaseConfig
 from schema import Verdict
 from schema.webhook_event import *
@@ -14,37 +17,29 @@ from redisutil.repository import job_repository
 from worker.webhook_manager import AsyncWebhookManager
 
 
-def _build_docker_run_cmd(
-    tmp_code_path: str,
+@functools.lru_cache(maxsize=256)
+def _get_docker_run_cmd_parts(
     code_language: CodeLanguage,
-    test_cases: list[list[list, str]],
     test_case_memory_limit_mb: int,
     test_case_time_limit_sec: float,
-    cpu_core_limit: float = 0.5
-) -> list[str]:
-    """도커 실행 명령어 생성 함수
+    cpu_core_limit: float
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """도커 실행 명령어 고정 부분 조회 함수
 
-    코드 채점을 위한 도커 컨테이너 실행 명령어를 생성합니다. 보안 및 리소스 제한 설정을 포함합니다.
+    작업마다 달라지지 않는 옵션(보안, 리소스 제한, 채점 스크립트 마운트 등)과 이미지 이름, 제한 값 인자를
+    (언어, 메모리 제한, 실행 시간 제한, CPU 코어 수) 조합별로 한 번만 생성하여 캐싱합니다.
+    제한 값은 챌린지와 언어에 따라 정해지므로 조합의 수는 (챌린지 수 x 언어 수) 이내로 제한됩니다.
 
     Args:
-        tmp_code_path (str): temp 디렉토리에 생성된 코드 파일 경로
         code_language (CodeLanguage): 프로그래밍 언어
-        test_cases (list): 테스트 케이스(입력값, 기대값) 리스트
         test_case_memory_limit_mb (int): 챌린지 메모리 제한(MB)
         test_case_time_limit_sec (float): 챌린지 실행 시간 제한(초)
         cpu_core_limit (float): 실행 환경 할당 CPU 코어 수
 
-    Notes:
-        cpu_core_limit의 경우 사양에 따라 min 값을 1정도로 기본 값을 할당 해도 괜찮음
-        또는 외부에서 테스트 케이스 별로 설정하는 방식으로 사용 가능
-
     Returns:
-        list[str]: 도커 실행 명령어 리스트
+        tuple: (작업별 마운트 앞에 위치하는 옵션, 이미지 이름 및 실행 스크립트, 테스트 케이스 뒤에 전달할 제한 값 인자)
     """
 
-    # tmp_code_path에서 디렉터리 정보, 파일 이름 분리
-    tmp_directory_path, code_file_name = os.path.split(tmp_code_path)
-
     # seccomp 보안 프로필 경로 로드
     seccomp_profile_path = DockerConfig.get_seccomp_profile_path()
 
@@ -54,20 +49,14 @@ def _build_docker_run_cmd(
     # 내부 프로세스 수 상한
     pids_limit = 50
 
-    return [
-        "docker", "run", "--rm", "-t",                                                                  # --rm: 컨테이너가 종료될 때 컨테이너와 관련된 리소스(파일 시스템, 볼륨) 제거, -t: 컨테이너 출력을 즉시 read하기 위해 컨테이너에 가상 TTY 할당하고 subprocess의 I/O 스트림과 직접 연결
+    prefix = (
+        DockerConfig.get_docker_binary_path(), "run", "--rm", "-t",                                     # --rm: 컨테이너가 종료될 때 컨테이너와 관련된 리소스(파일 시스템, 볼륨) 제거, -t: 컨테이너 출력을 즉시 read하기 위해 컨테이너에 가상 TTY 할당하고 subprocess의 I/O 스트림과 직접 연결
 
-        "--mount", f"type=bind,source={tmp_directory_path},target=/tmp",                                # 컨테이너 내부에서 쓰기 가능한 파일 시스템 마운트
-        "--mount", f"type=bind,source={tmp_code_path},target=/tmp/{code_file_name},readonly",    # 소스코드 마운트
         "--mount", f"type=bind,source={sandbox_script_path},target=/tmp/run.sh,readonly",               # 채점 스크립트 마운트
         "--read-only",                                                                                  # 파일 시스템은 기본적으로 읽기 전용 설정
 
         "--ulimit", "nofile=32:32",                                                                     # 열 수 있는 파일 수 제한
         "--ulimit", f"fsize=1572864",                                                                   # 최대 파일 크기 1.5MB로 제한
-
-        "--memory", f"{test_case_memory_limit_mb}m",                                                    # 메모리 제한 (컨테이너 유지 비용, time/perf 실행 비용, tmpfs 유지 비용을 고려, 여유분 16mb 추가 할당), 내부 하위 프로세스는 메모리 사용 초과 시 SIGKILL 처리 되어 -9 반환하고 종료됨
-        "--memory-swap", f"{test_case_memory_limit_mb}m",                                               # 메모리 제한을 정확하게 적용하기 위해 메모리 스왑 (디스크 할당) 금지
-        "--cpus", f"{cpu_core_limit}",                                                                  # CPU 코어 수 제한 (서버 사양에 따라 여유가 있다면 1로 설정해도 괜찮음)
         "--pids-limit", f"{pids_limit}",                                                                # 프로세스 수 제한
 
         "--network", "none",                                                                            # 네트워크 차단
@@ -78,41 +67,191 @@ def _build_docker_run_cmd(
         "--workdir", f"/tmp",                                                                           # WORKDIR 설정, 모든 명령어 실행 루트
         "--init",                                                                                       # 좀비 프로세스가 생성되는 것을 방지하기 위해 init 프로세스를 컨테이너 내부 최상단 프로세스로 생성
 
+        "--memory", f"{test_case_memory_limit_mb}m",                                                    # 메모리 제한 (컨테이너 유지 비용, time/perf 실행 비용, tmpfs 유지 비용을 고려, 여유분 16mb 추가 할당), 내부 하위 프로세스는 메모리 사용 초과 시 SIGKILL 처리 되어 -9 반환하고 종료됨
+        "--memory-swap", f"{test_case_memory_limit_mb}m",                                               # 메모리 제한을 정확하게 적용하기 위해 메모리 스왑 (디스크 할당) 금지
+        "--cpus", f"{cpu_core_limit}",                                                                  # CPU 코어 수 제한 (서버 사양에 따라 여유가 있다면 1로 설정해도 괜찮음)
+    )
+
+    image_and_script = (
         f"{sandbox_image}",                                                                             # 도커 이미지 설정
+        f"/tmp/run.sh",                                                                                 # 컨테이너 내부에서 실행할 채점 스크립트
+    )
 
-        # 컨테이너로 전달할 추가 시스템 argument
-        f"/tmp/run.sh",
-        json.dumps(test_cases),                                                                         # 테스트 케이스 입력 값 리스트 (JSON 직렬화)
+    limit_args = (
         str(test_case_time_limit_sec),                                                                  # 테스트 케이스 실행 시간 제한
         str(test_case_memory_limit_mb)                                                                  # 테스트 케이스 메모리 상한
+    )
+
+    return prefix, image_and_script, limit_args
+
+
+@functools.lru_cache(maxsize=256)
+def _get_serialized_test_cases(challenge_id: int) -> tuple[str, ...]:
+    """챌린지별 테스트 케이스 직렬화 결과 조회 함수
+
+    제출마다 같은 테스트 케이스를 다시 직렬화하지 않도록, 테스트 케이스 하나씩 JSON 문자열로 변환한 결과를 챌린지별로 캐싱합니다.
+    챌린지별로 한 번만 실행되므로 orjson 대신 64비트를 초과하는 정수도 그대로 직렬화하는 표준 json을 사용합니다. (ensure_ascii 기본값 유지)
+
+    Args:
+        challenge_id (int): 챌린지 ID
+
+    Returns:
+        tuple[str, ...]: 테스트 케이스별 JSON 문자열
+    """
+    return tuple(json.dumps(test_case) for test_case in TestCaseConfig.get_test_cases(challenge_id))
+
+
+def _build_docker_run_cmd(
+    tmp_code_path: str,
+    code_language: CodeLanguage,
+    test_cases_json: str,
+    test_case_memory_limit_mb: int,
+    test_case_time_limit_sec: float,
+    cpu_core_limit: float = 0.5
+) -> list[str]:
+    """도커 실행 명령어 생성 함수
+
+    코드 채점을 위한 도커 컨테이너 실행 명령어를 생성합니다. 보안 및 리소스 제한 설정을 포함합니다.
+    고정 옵션과 제한 값 인자는 _get_docker_run_cmd_parts에서 캐싱된 값을 사용하고, 작업별로 달라지는 값만 새로 생성합니다.
+
+    Args:
+        tmp_code_path (str): temp 디렉토리에 생성된 코드 파일 경로
+        code_language (CodeLanguage): 프로그래밍 언어
+        test_cases_json (str): JSON 직렬화된 테스트 케이스(입력값, 기대값) 리스트
+        test_case_memory_limit_mb (int): 챌린지 메모리 제한(MB)
+        test_case_time_limit_sec (float): 챌린지 실행 시간 제한(초)
+        cpu_core_limit (float): 실행 환경 할당 CPU 코어 수
+
+    Notes:
+        cpu_core_limit의 경우 사양에 따라 min 값을 1정도로 기본 값을 할당 해도 괜찮음
+        또는 외부에서 테스트 케이스 별로 설정하는 방식으로 사용 가능
+
+    Returns:
+        list[str]: 도커 실행 명령어 리스트
+    """
+
+    # tmp_code_path에서 디렉터리 정보, 파일 이름 분리
+    tmp_directory_path, code_file_name = os.path.split(tmp_code_path)
+
+    prefix, image_and_script, limit_args = _get_docker_run_cmd_parts(
+        code_language, test_case_memory_limit_mb, test_case_time_limit_sec, cpu_core_limit
+    )
+
+    return [
+        *prefix,
+
+        "--mount", f"type=bind,source={tmp_directory_path},target=/tmp",                                # 컨테이너 내부에서 쓰기 가능한 파일 시스템 마운트
+        "--mount", f"type=bind,source={tmp_code_path},target=/tmp/{code_file_name},readonly",           # 소스코드 마운트
+
+        *image_and_script,
+
+        # 컨테이너로 전달할 추가 시스템 argument
+        test_cases_json,                                                                                # 테스트 케이스 입력 값 리스트 (JSON 직렬화)
+        *limit_args                                                                                     # 테스트 케이스 실행 시간 제한, 메모리 상한
     ]
 
 
-async def handle_webhook_response(
-    future: asyncio.Future,
+# 컨테이너 출력 스트림을 한 번에 읽어올 최대 바이트 수
+_STREAM_READ_CHUNK_SIZE = 65536
+
+# 개행 없이 버퍼에 쌓일 수 있는 최대 바이트 수 (StreamReader.readline의 기본 한도와 동일)
+_STREAM_LINE_LIMIT = 65536
+
+
+async def _iter_stream_lines(stream: asyncio.StreamReader):
+    """스트림 라인 단위 비동기 제너레이터
+
+    readline()으로 한 줄마다 await 하지 않고, 스트림을 청크 단위로 읽은 뒤 버퍼에서 개행 기준으로 분리합니다.
+
+    Args:
+        stream (StreamReader): asyncio 스트림 리더
+
+    Yields:
+        bytes: 개행 문자를 포함한 한 줄 (스트림 종료 시 개행 없이 남은 데이터는 마지막 줄로 반환)
+
+    Raises:
+        ValueError: 개행 없이 _STREAM_LINE_LIMIT를 초과하는 출력이 들어온 경우
+    """
+    buffer = bytearray()
+    while True:
+        chunk = await stream.read(_STREAM_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer += chunk
+
+        start = 0
+        while (newline_index := buffer.find(b'\n', start)) != -1:
+            # 이전 청크에서 넘어온 데이터와 합쳐진 줄도 한도를 넘지 않도록 분리된 줄마다 길이 확인
+            if newline_index - start > _STREAM_LINE_LIMIT:
+                raise ValueError(f"Line from container exceeds the limit ({_STREAM_LINE_LIMIT} bytes)")
+            yield bytes(buffer[start:newline_index + 1])
+            start = newline_index + 1
+        if start:
+            del buffer[:start]
+
+        # 개행이 아직 나오지 않은 나머지 데이터도 한도를 넘으면 다음 청크를 기다리지 않고 중단
+        if len(buffer) > _STREAM_LINE_LIMIT:
+            raise ValueError(f"Line from container exceeds the limit ({_STREAM_LINE_LIMIT} bytes)")
+
+    if buffer:
+        yield bytes(buffer)
+
+
+# 작업(Job)별로 웹훅 전송을 처리하는 워커 수 (동시 전송 수 상한)
+_WEBHOOK_WORKER_COUNT = 8
+
+
+async def webhook_worker(
+    webhook_queue: asyncio.Queue,
     proc: asyncio.subprocess.Process,
     cleanup_job_and_return_event: asyncio.Event,
-    job_id: str
+    job_id: str,
+    webhook_manager: AsyncWebhookManager
 ) -> None:
-    """웹훅 응답 처리 코루틴
+    """웹훅 전송 워커 코루틴
 
-    웹훅 전송 결과를 처리하고 실패 시 리소스 정리 작업을 수행합니다.
+    큐에 들어온 웹훅 이벤트를 순서대로 전송하고 실패 시 리소스 정리 작업을 수행합니다.
+    verdict마다 Task를 생성하지 않고, 고정된 수의 워커가 큐를 소비하여 동시 전송 수를 제한합니다.
 
     Args:
-        future (Future): 웹훅 전송 Future 객체
+        webhook_queue (Queue): 전송할 웹훅 이벤트 큐
         proc (Process): 실행 중인 도커 프로세스
         cleanup_job_and_return_event (Event): 채점 실패/불가한 경우, 리소스 정리 및 메인 프로세스 종료를 예약하기 위한 이벤트
         job_id (str): 작업 ID
+        webhook_manager (AsyncWebhookManager): 웹훅 매니저
 
     Returns:
         None
     """
-    response_code = await future
-    if response_code != 200:
-        logging.error(f"Webhook failed with code {response_code} for job {job_id}")
-        if proc.returncode is None:  # 프로세스가 아직 살아있을 때만 kill
-            proc.kill()
-        cleanup_job_and_return_event.set()
+    while True:
+        webhook_event = await webhook_queue.get()
+        try:
+            response_code = await webhook_manager.dispatch_webhook_callback(webhook_event)
+            if response_code != 200:
+                logging.error(f"Webhook failed with code {response_code} for job {job_id}")
+                if proc.returncode is None:  # 프로세스가 아직 살아있을 때만 kill
+                    proc.kill()
+                cleanup_job_and_return_event.set()
+        finally:
+            # 큐의 join()이 모든 이벤트 전송 완료를 확인할 수 있도록 처리 완료 표시
+            webhook_queue.task_done()
+
+
+# 오류 메시지에 포함할 예상치 못한 출력의 최대 줄 수 및 출력 처리를 중단할 누적 크기
+_UNEXPECTED_OUTPUT_MAX_LINES = 32
+_UNEXPECTED_OUTPUT_MAX_SIZE = 65536
+
+# 컴파일/런타임 에러 종료 코드 -> 실패 원인 매핑 (0: 기본값, 124: timeout, 137: SIGKILL(메모리 초과))
+_COMPILE_FAILURE_REASON_MAP = {
+    0: FailureCause.COMPILE_ERROR,
+    124: FailureCause.COMPILE_TIMEOUT,
+    137: FailureCause.COMPILE_OUT_OF_MEMORY
+}
+_RUNTIME_FAILURE_REASON_MAP = {
+    0: FailureCause.RUNTIME_ERROR,
+    124: FailureCause.RUNTIME_TIMEOUT,
+    137: FailureCause.RUNTIME_OUT_OF_MEMORY
+}
 
 
 async def async_handle_output(
@@ -121,66 +260,76 @@ async def async_handle_output(
     cleanup_job_and_return_event,
     job_id: str,
     verdicts: list[Verdict],
-    webhook_manager: AsyncWebhookManager,
-    tasks: list[asyncio.Task],
-    stream_name: str
-) -> None:
+    webhook_queue: asyncio.Queue
+) -> bool:
     """Docker 컨테이너 출력을 비동기적으로 처리하는 함수
 
-    컨테이너 내부 스트림 출력을 파싱하고 결과를 웹훅으로 전송합니다.
+    컨테이너 내부 스트림 출력을 파싱하고 결과를 웹훅 전송 큐에 추가합니다.
 
     Args:
-        stream (StreamReader): asyncio 스트림 리더 (stdout 또는 stderr)
+        stream (StreamReader): asyncio 스트림 리더 (stderr가 합쳐진 stdout)
         proc (Process): 실행 중인 도커 프로세스
         cleanup_job_and_return_event (Event): 작업 정리 이벤트
         job_id (str): 작업 ID
         verdicts (list[Verdict]): 결과를 저장할 Verdict 객체 리스트
-        webhook_manager (AsyncWebhookManager): 웹훅 매니저
-        tasks (list[Task]): 웹훅 응답 처리 작업 리스트
-        stream_name (str): stdout 또는 stderr
+        webhook_queue (Queue): 웹훅 워커가 전송할 이벤트 큐
 
     Returns:
-        None
+        bool: 출력 처리 중 오류가 발생하여 채점 불가(Error) 알림을 전송해야 하는 경우 True
     """
     unexpected_output = []
-    try:
-        while True:
-            line = await stream.readline()
-            if not line:
-                break
+    unexpected_output_line_count = 0
+    unexpected_output_size = 0
 
+    def add_unexpected_output(output: bytes) -> bool:
+        """예상치 못한 출력을 최대 줄 수까지만 보관하고, 누적 크기가 상한을 초과하면 True 반환"""
+        nonlocal unexpected_output_line_count, unexpected_output_size
+        if unexpected_output_line_count < _UNEXPECTED_OUTPUT_MAX_LINES:
             # 디코딩 불가능한 경우 '�'로 대체
-            line_str = line.decode('utf-8', errors='replace').strip()
-            if not line_str:
-                continue
+            unexpected_output.append(output.decode('utf-8', errors='replace'))
+        unexpected_output_line_count += 1
+        unexpected_output_size += len(output)
+        return unexpected_output_size > _UNEXPECTED_OUTPUT_MAX_SIZE
 
-            if stream_name == 'stderr':
-                unexpected_output.append(line_str)
+    try:
+        # 한 줄마다 readline()을 await 하지 않고, 청크 단위로 읽어 분리된 줄을 처리
+        async for line in _iter_stream_lines(stream):
+            # 디코딩하지 않고 bytes 그대로 공백 제거 및 JSON 파싱 (예상치 못한 출력으로 보관하는 경우에만 디코딩)
+            line = line.strip()
+            if not line:
                 continue
 
             try:
-                result = json.loads(line_str)
+                result = orjson.loads(line)
 
                 # JSON 이지만 dict가 아닌 단순 정수형 데이터 등인 경우는 알 수 없는 출력 처리
                 if not isinstance(result, dict):
-                    unexpected_output.append(line_str)
+                    if add_unexpected_output(line):
+                        break
                     continue
 
-                error_status = result.get('status')
+                # 대부분의 출력은 통과한 테스트 케이스이므로 통과 여부를 가장 먼저 확인하여 나머지 키 조회를 생략
                 passed = result.get('passed')
 
-                if isinstance(error_status, str):
+                if passed is True:
+                    verdict = Verdict(
+                        test_case_index=result.get('testCaseIndex'),
+                        passed=True,
+                        elapsed_time_ms=result.get('elapsedTimeMs'),
+                        memory_usage_mb=result.get('memoryUsageMb')
+                    )
+                    verdicts.append(verdict)
+
+                    webhook_queue.put_nowait(TestCaseResult(job_id, verdict))
+
+                elif isinstance(error_status := result.get('status'), str):
                     # 시스템 에러
                     if error_status == 'systemError':
                         raise Exception(result.get('error'))
 
                     exit_code = int(result.get('exitCode'))
-                    failure_reason_map = {
-                        0: FailureCause.COMPILE_ERROR if error_status == 'compileError' else FailureCause.RUNTIME_ERROR,
-                        124: FailureCause.COMPILE_TIMEOUT if error_status == 'compileError' else FailureCause.RUNTIME_TIMEOUT,
-                        137: FailureCause.COMPILE_OUT_OF_MEMORY if error_status == 'compileError' else FailureCause.RUNTIME_OUT_OF_MEMORY
-                    }
-                    default_failure_reason = failure_reason_map.get(0)
+                    failure_reason_map = _COMPILE_FAILURE_REASON_MAP if error_status == 'compileError' else _RUNTIME_FAILURE_REASON_MAP
+                    default_failure_reason = failure_reason_map[0]
 
                     # 컴파일/런타임 에러 처리
                     verdict = Verdict(
@@ -191,102 +340,122 @@ async def async_handle_output(
                     )
                     verdicts.append(verdict)
 
-                    webhook_event = TestCaseResult(job_id, verdict)
-                    future = asyncio.ensure_future(webhook_manager.dispatch_webhook_callback(webhook_event))
-                    tasks.append(asyncio.create_task(
-                        handle_webhook_response(future, proc, cleanup_job_and_return_event, job_id)))
+                    webhook_queue.put_nowait(TestCaseResult(job_id, verdict))
 
-                elif isinstance(passed, bool):
+                elif passed is False:
                     verdict = Verdict(
                         test_case_index=result.get('testCaseIndex'),
-                        passed=passed,
+                        passed=False,
+                        failure_cause=FailureCause.WRONG_ANSWER
                     )
-                    if not passed:
-                        verdict.failure_cause=FailureCause.WRONG_ANSWER
-                    else:
-                        verdict.elapsed_time_ms=result.get('elapsedTimeMs')
-                        verdict.memory_usage_mb=result.get('memoryUsageMb')
                     verdicts.append(verdict)
 
-                    webhook_event = TestCaseResult(job_id, verdict)
-                    future = asyncio.ensure_future(webhook_manager.dispatch_webhook_callback(webhook_event))
-                    tasks.append(asyncio.create_task(
-                        handle_webhook_response(future, proc, cleanup_job_and_return_event, job_id)))
+                    webhook_queue.put_nowait(TestCaseResult(job_id, verdict))
 
                 else:
-                    unexpected_output.append(line_str)
+                    # status, passed 모두 없는 dict는 알 수 없는 출력 처리
+                    if add_unexpected_output(line):
+                        break
 
                 logging.info(f"[DEBUG] {result}")
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # JSON이 아닌 경우 예상치 못한 출력으로 간주
-                unexpected_output.append(line_str)
+                if add_unexpected_output(line):
+                    break
 
+        # 예상치 못한 출력이 상한을 초과한 경우, 남은 출력은 읽지 않고 아래 예외 처리에서 컨테이너 종료
         if unexpected_output:
-            raise Exception(f"Unexpected output from container: {("\n".join(unexpected_output))}")
+            omitted_line_count = unexpected_output_line_count - len(unexpected_output)
+            omitted_message = f"\n... ({omitted_line_count} more lines)" if omitted_line_count else ""
+            raise Exception(f"Unexpected output from container: {("\n".join(unexpected_output))}{omitted_message}")
 
     except Exception:
         logging.error(f"Unexpected error occurred during handling job sandbox for job {job_id}", exc_info=True)
 
-        proc.kill()
+        if proc.returncode is None:  # 프로세스가 아직 살아있을 때만 kill
+            proc.kill()
         cleanup_job_and_return_event.set()
-        await webhook_manager.dispatch_webhook_callback(Error(job_id))
+        # 채점 불가 알림은 TaskGroup 종료 후 호출자가 전송 (취소 시 전송 작업이 이벤트 루프에 남지 않도록 함)
+        return True
 
+    return False
 
-async def async_execute_code(user_id: int, job: Job, webhook_manager: AsyncWebhookManager):
-    try:
-        # 고유한 임시 디렉토리 생성 및 코드 파일 생성, with 블록을 벗어나면 내부 리소스 자동 제거
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # 소스 코드 임시 파일 생성
-            code_decoded = base64.b64decode(job.code).decode("utf-8")
-            code_file_name = DockerConfig.get_source_code_file_name(job.code_language)
-
-            tmp_code_path = os.path.join(tmp_dir, f"{code_file_name}")
-            with open(tmp_code_path, "w", encoding="utf-8") as f:
-                f.write(code_decoded)
-
-            test_cases = TestCaseConfig.get_test_cases(job.challenge_id)
-            test_case_memory_limit = TestCaseConfig.get_memory_limit(job.challenge_id, job.code_language)
-            test_case_time_limit = TestCaseConfig.get_time_limit(job.challenge_id, job.code_language)
-
-            is_sandbox_timed_out = False
-            language_with_compile_process = (
-            CodeLanguage.JAVA17, CodeLanguage.PYTHON3, CodeLanguage.C11, CodeLanguage.CPP17)
-            compile_time_bonus = 5.0 if job.code_language in language_with_compile_process else 0.0
-
-            # sandbox 타임아웃 설정
-            sandbox_time_limit = len(test_cases) * test_case_time_limit + compile_time_bonus + 3.0  # 기타 오버 헤드 감안 3.0초 추가 할당
-
-            tasks = []
-            verdicts = []
-            cleanup_job_and_return_event = asyncio.Event()
-
-            # Docker 명령어 생성
-            docker_cmd = _build_docker_run_cmd(
-                tmp_code_path,
-                job.code_language,
-                random.sample(test_cases, len(test_cases)),
-                test_case_memory_limit,
-                test_case_time_limit
-            )
 
-            # 비동기 서브프로세스로 sandbox 실행
-            sandbox_proc = await asyncio.create_subprocess_exec(
-                *docker_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+async def async_execute_code(user_id: int, job: Job, webhook_manager: AsyncWebhookManager):
+    # asyncio의 이벤트 루프가 프로세스 종료 시(sandbox_proc.returncode가 설정된 후),
+    # 내부적으로 파이프(sandbox_proc.stdout)는 자동으로 close
+    # 만약 subprocess.Popen를 직접 사용하는 경우, pipe 수명 관리를 직접 해야함
+    # webhook_manager(세션, 연결 풀)는 여러 작업이 공유하므로 여기서 종료하지 않고 호출자(워커 프로세스)가 수명을 관리
+    # 고유한 임시 디렉토리 생성 및 코드 파일 생성, with 블록을 벗어나면 내부 리소스 자동 제거
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 소스 코드 임시 파일 생성
+        # base64 디코딩 결과(UTF-8 bytes)를 문자열로 변환하지 않고 그대로 기록
+        code_bytes = base64.b64decode(job.code)
+        code_file_name = DockerConfig.get_source_code_file_name(job.code_language)
+
+        tmp_code_path = os.path.join(tmp_dir, f"{code_file_name}")
+        # 텍스트 모드 인코딩, 버퍼 생성 없이 파일 디스크립터에 직접 기록 (컨테이너 내부 사용자가 읽을 수 있도록 0o644)
+        code_fd = os.open(tmp_code_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(code_fd, code_bytes)
+        finally:
+            os.close(code_fd)
+
+        # 캐싱된 테스트 케이스별 JSON 문자열의 순서만 섞은 뒤 JSON 배열로 연결
+        serialized_test_cases = list(_get_serialized_test_cases(job.challenge_id))
+        random.shuffle(serialized_test_cases)
+        test_cases_json = "[" + ",".join(serialized_test_cases) + "]"
+        test_case_memory_limit = TestCaseConfig.get_memory_limit(job.challenge_id, job.code_language)
+        test_case_time_limit = TestCaseConfig.get_time_limit(job.challenge_id, job.code_language)
+
+        is_sandbox_timed_out = False
+        language_with_compile_process = (
+        CodeLanguage.JAVA17, CodeLanguage.PYTHON3, CodeLanguage.C11, CodeLanguage.CPP17)
+        compile_time_bonus = 5.0 if job.code_language in language_with_compile_process else 0.0
+
+        # sandbox 타임아웃 설정
+        sandbox_time_limit = len(serialized_test_cases) * test_case_time_limit + compile_time_bonus + 3.0  # 기타 오버 헤드 감안 3.0초 추가 할당
+
+        verdicts = []
+        cleanup_job_and_return_event = asyncio.Event()
+        # 테스트 케이스 결과 웹훅 전송 대기 큐
+        # 웹훅 수신 서버가 느려도 출력 읽기가 멈추지 않도록 크기 제한을 두지 않음
+        # (출력 읽기가 멈추면 컨테이너가 출력 쓰기에서 대기하여 샌드박스 타임아웃으로 오판될 수 있음, 동시 전송 수는 워커 수로 제한)
+        webhook_queue = asyncio.Queue()
+
+        # Docker 명령어 생성
+        docker_cmd = _build_docker_run_cmd(
+            tmp_code_path,
+            job.code_language,
+            test_cases_json,
+            test_case_memory_limit,
+            test_case_time_limit
+        )
+
+        # 비동기 서브프로세스로 sandbox 실행
+        sandbox_proc = await asyncio.create_subprocess_exec(
+            *docker_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            # docker CLI 자체의 오류 출력도 하나의 파이프로 합쳐 단일 작업에서 처리 (JSON이 아닌 출력은 예상치 못한 출력으로 처리됨)
+            stderr=asyncio.subprocess.STDOUT
+        )
+
+        # 출력 처리 작업과 웹훅 전송 워커를 하나의 TaskGroup으로 묶어 관리
+        # 블록 내부나 하위 작업에서 예외 발생 시 나머지 작업이 모두 취소된 후 블록을 벗어나므로 작업이 남지 않음
+        async with asyncio.TaskGroup() as task_group:
+            # 고정된 수의 웹훅 전송 워커 실행
+            webhook_workers = [
+                task_group.create_task(
+                    webhook_worker(webhook_queue, sandbox_proc, cleanup_job_and_return_event, job.job_id, webhook_manager)
+                )
+                for _ in range(_WEBHOOK_WORKER_COUNT)
+            ]
 
             # sandbox 출력 처리는 백그라운드 작업 실행
             # asyncio에 의해 자동으로 스케줄링
-            stdout_task = asyncio.create_task(
-                async_handle_output(sandbox_proc.stdout, sandbox_proc, cleanup_job_and_return_event, job.job_id, verdicts, webhook_manager, tasks, 'stdout')
+            output_task = task_group.create_task(
+                async_handle_output(sandbox_proc.stdout, sandbox_proc, cleanup_job_and_return_event, job.job_id, verdicts, webhook_queue)
             )
-            stderr_task = asyncio.create_task(
-                async_handle_output(sandbox_proc.stderr, sandbox_proc, cleanup_job_and_return_event, job.job_id, verdicts, webhook_manager, tasks, 'stderr')
-            )
-
-            tasks.append(stdout_task)
-            tasks.append(stderr_task)
 
             try:
                 await asyncio.wait_for(sandbox_proc.wait(), timeout=sandbox_time_limit)
@@ -297,56 +466,57 @@ async def async_execute_code(user_id: int, job: Job, webhook_manager: AsyncWebho
                 sandbox_proc.kill()
                 is_sandbox_timed_out = True
 
-            # Thread.join()과 유사하게, 백그라운드 작업(모든 테스트 케이스에 대한 verdict 전달) 완료 시점까지 대기
-            await asyncio.gather(*tasks)
+            # Thread.join()과 유사하게, 출력 처리 완료 후 큐에 쌓인 모든 테스트 케이스에 대한 verdict 전달 완료 시점까지 대기
+            await output_task
+            await webhook_queue.join()
 
-            # 하위 task의 채점 실패/불가 이벤트 확인
-            if cleanup_job_and_return_event.is_set():
-                job_repository.delete(job.job_id, user_id)
-                return
+            # 큐 대기 중인 워커 종료 (TaskGroup은 취소된 하위 작업을 오류로 취급하지 않음)
+            for worker in webhook_workers:
+                worker.cancel()
 
-            if any(not v.passed for v in verdicts):
-                # 이미 컴파일/런타임 단계에서 실패한 경우, 샌드박스 레벨의 추가 실패 원인은 기록하지 않음
-                # (예: 런타임에서 WRONG_ANSWER 발생 후 샌드박스 메모리 초과 시, 첫 번째 실패 사유 우선)
-                pass
-            else:
-                if is_sandbox_timed_out:
-                    verdict = Verdict(
-                        passed=False,
-                        failure_cause=FailureCause.SANDBOX_TIMEOUT,
-                        failure_detail="최대 실행 시간 제한을 초과하였습니다"
-                    )
-                    verdicts.append(verdict)
-                    webhook_event = TestCaseResult(job.job_id, verdict)
-                    await webhook_manager.dispatch_webhook_callback(webhook_event)
-                elif sandbox_proc.returncode == 137:
-                    verdict = Verdict(
-                        passed=False,
-                        failure_cause=FailureCause.SANDBOX_OUT_OF_MEMORY,
-                        failure_detail="최대 메모리 사용량 제한을 초과하였습니다"
-                    )
-                    verdicts.append(verdict)
-                    webhook_event = TestCaseResult(job.job_id, verdict)
-                    await webhook_manager.dispatch_webhook_callback(webhook_event)
-
-            judgment = create_judgment_from_verdicts(
-                user_id=user_id,
-                job_id=job.job_id,
-                challenge_id=job.challenge_id,
-                code_language=job.code_language,
-                code=job.code,
-                code_byte_size=len(job.code),
-                submitted_at=job.submitted_at,
-                verdicts=verdicts
-            )
+        # 출력 처리 중 오류가 발생한 경우 채점 불가 알림 전송
+        if output_task.result():
+            await webhook_manager.dispatch_webhook_callback(Error(job.job_id))
 
-            await webhook_manager.dispatch_webhook_callback(judgment)
+        # 하위 task의 채점 실패/불가 이벤트 확인
+        if cleanup_job_and_return_event.is_set():
             job_repository.delete(job.job_id, user_id)
-
-    # finally는 os._exit(code)를 호출하는 경우(os.exit(code)와 다름)를 제외하고 항상 실행 됨
-    finally:
-        await webhook_manager.shutdown()
-        # asyncio의 이벤트 루프가 프로세스 종료 시(sandbox_proc.returncode가 설정된 후),
-        # 내부적으로 파이프(sandbox_proc.stdout, sandbox_proc.stderr)는 자동으로 close
-        # 만약 subprocess.Popen를 직접 사용하는 경우, pipe 수명 관리를 직접 해야함
-        # TemporaryDirectory는 with 블록 벗어나면서 tmp_dir 이하 자원을 자동 정리
\ No newline at end of file
+            return
+
+        if any(not v.passed for v in verdicts):
+            # 이미 컴파일/런타임 단계에서 실패한 경우, 샌드박스 레벨의 추가 실패 원인은 기록하지 않음
+            # (예: 런타임에서 WRONG_ANSWER 발생 후 샌드박스 메모리 초과 시, 첫 번째 실패 사유 우선)
+            pass
+        else:
+            if is_sandbox_timed_out:
+                verdict = Verdict(
+                    passed=False,
+                    failure_cause=FailureCause.SANDBOX_TIMEOUT,
+                    failure_detail="최대 실행 시간 제한을 초과하였습니다"
+                )
+                verdicts.append(verdict)
+                webhook_event = TestCaseResult(job.job_id, verdict)
+                await webhook_manager.dispatch_webhook_callback(webhook_event)
+            elif sandbox_proc.returncode == 137:
+                verdict = Verdict(
+                    passed=False,
+                    failure_cause=FailureCause.SANDBOX_OUT_OF_MEMORY,
+                    failure_detail="최대 메모리 사용량 제한을 초과하였습니다"
+                )
+                verdicts.append(verdict)
+                webhook_event = TestCaseResult(job.job_id, verdict)
+                await webhook_manager.dispatch_webhook_callback(webhook_event)
+
+        judgment = create_judgment_from_verdicts(
+            user_id=user_id,
+            job_id=job.job_id,
+            challenge_id=job.challenge_id,
+            code_language=job.code_language,
+            code=job.code,
+            code_byte_size=len(job.code),
+            submitted_at=job.submitted_at,
+            verdicts=verdicts
+        )
+
+        await webhook_manager.dispatch_webhook_callback(judgment)
+        job_repository.delete(job.job_id, user_id)
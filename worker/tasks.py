@@ -1,8 +1,97 @@
+import threading
+from typing import Optional
+
+import redis
+from celery.signals import worker_process_shutdown
+
 from worker import celery_app as app
 from worker.helpers import *
 from schema.job import CodeChallengeJudgmentJob as Job
 
-@app.task(bind=True, autoretry_for=(Exception,), retry_backoff=True, retry_kwargs={'max_retries': 3})
+# uvloop(libuv 기반 이벤트 루프)이 설치된 환경에서는 서브프로세스 파이프, 소켓 I/O 처리가 더 빠른 uvloop 사용
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# 테스트 케이스 설정은 워커 모듈 임포트 시점에 로드하여 파일이 없거나 잘못된 경우 워커 기동 단계에서 실패하도록 함
+# prefork 풀에서는 부모 프로세스에서 한 번만 파싱되고 자식 프로세스는 fork로 복제된 데이터를 그대로 사용
+TestCaseConfig.preload()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """uvloop 사용 가능한 경우 uvloop 이벤트 루프를, 그렇지 않은 경우 asyncio 기본 이벤트 루프를 생성"""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+# 실행 스레드마다 한 번만 생성하여 해당 스레드의 모든 작업이 공유하는 이벤트 루프와 웹훅 매니저
+# 작업마다 세션(연결 풀)을 새로 만들면 웹훅 서버와의 TCP/TLS 연결을 매번 다시 맺어야 하므로 스레드 수명 동안 재사용
+# prefork 풀(스레드 1개)에서는 프로세스당 하나가 되고, threads 풀처럼 여러 작업이 동시에 실행되는 경우에도
+# 하나의 루프를 두 스레드가 동시에 run_until_complete 하지 않도록 스레드별로 분리
+# prefork 풀에서 부모 프로세스의 루프/소켓이 자식 프로세스로 복제되지 않도록 모듈 임포트 시점이 아닌 첫 작업 실행 시점에 생성
+_thread_local = threading.local()
+
+# 워커 프로세스 종료 시 정리하기 위해 생성된 (이벤트 루프, 웹훅 매니저) 목록을 보관
+_created_loops: list[tuple[asyncio.AbstractEventLoop, AsyncWebhookManager]] = []
+_created_loops_lock = threading.Lock()
+
+
+def _get_loop_and_webhook_manager() -> tuple[asyncio.AbstractEventLoop, AsyncWebhookManager]:
+    """현재 스레드 전용 이벤트 루프와 초기화된 웹훅 매니저를 반환 (없는 경우 생성)"""
+    loop: Optional[asyncio.AbstractEventLoop] = getattr(_thread_local, 'loop', None)
+    webhook_manager: Optional[AsyncWebhookManager] = getattr(_thread_local, 'webhook_manager', None)
+
+    if loop is None or loop.is_closed():
+        loop = _new_event_loop()
+        # 생성된 Task를 이벤트 루프 스케줄링 없이 첫 번째 await 지점까지 즉시 실행 (Python 3.12+)
+        loop.set_task_factory(asyncio.eager_task_factory)
+        # aiohttp 세션은 생성된 이벤트 루프에 묶이므로 루프를 새로 만든 경우 세션도 새로 생성
+        webhook_manager = AsyncWebhookManager()
+        loop.run_until_complete(webhook_manager.initialize())
+
+        _thread_local.loop = loop
+        _thread_local.webhook_manager = webhook_manager
+        with _created_loops_lock:
+            _created_loops.append((loop, webhook_manager))
+
+    return loop, webhook_manager
+
+
+@worker_process_shutdown.connect
+def _close_loops_and_webhook_managers(**kwargs):
+    """워커 프로세스 종료 시 생성된 모든 웹훅 매니저의 세션과 이벤트 루프를 정리"""
+    with _created_loops_lock:
+        created_loops = _created_loops[:]
+        _created_loops.clear()
+
+    for loop, webhook_manager in created_loops:
+        # 작업 실행 중인 루프는 해당 스레드가 사용 중이므로 정리하지 않음
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(webhook_manager.shutdown())
+        finally:
+            loop.close()
+
+
+# 재시도로 해결될 수 있는 일시적인 오류(Redis 연결 실패 및 타임아웃)만 작업을 재시도
+# 웹훅 전송 오류는 AsyncWebhookManager가 상태 코드로 변환하여 반환하므로 예외로 전파되지 않음
+_RETRYABLE_EXCEPTIONS = (
+    redis.exceptions.ConnectionError,
+    redis.exceptions.TimeoutError
+)
+
+
+@app.task(
+    bind=True,
+    autoretry_for=_RETRYABLE_EXCEPTIONS,
+    retry_backoff=True,
+    retry_backoff_max=30,   # 재시도 대기 시간 상한(초)
+    retry_jitter=True,      # 여러 작업이 동시에 재시도하지 않도록 대기 시간을 무작위로 분산
+    retry_kwargs={'max_retries': 3}
+)
 def execute_code(self, user_id: int, job_dict: dict):
     job = None
     loop = None
@@ -10,19 +99,15 @@ def execute_code(self, user_id: int, job_dict: dict):
 
     try:
         job = Job.create_from_dict(job_dict)
-        loop = asyncio.new_event_loop()
-        webhook_manager = AsyncWebhookManager()
-
-        # AsyncWebhookManager 초기화
-        loop.run_until_complete(webhook_manager.initialize())
+        loop, webhook_manager = _get_loop_and_webhook_manager()
         loop.run_until_complete(async_execute_code(user_id, job, webhook_manager))
     except Exception as e:
         if not job or not loop or not webhook_manager: raise
         logging.error(f"작업 실행 중 처리되지 않은 예외 발생\n작업 정보: {job_dict}", exc_info=True)
-        job_repository.delete(job.job_id, user_id)
+        # 이미 샌드박스 실행 및 테스트 케이스 결과 전송이 진행된 작업이므로, 작업 삭제 실패가 작업 재시도로 이어지지 않도록 로그만 남기고
+        # 채점 불가 알림은 반드시 전송
+        try:
+            job_repository.delete(job.job_id, user_id)
+        except Exception:
+            logging.error(f"작업 삭제 실패\n작업 ID: {job.job_id}", exc_info=True)
         loop.run_until_complete(webhook_manager.dispatch_webhook_callback(Error(job.job_id)))
-    finally:
-        if loop and webhook_manager:
-            loop.run_until_complete(webhook_manager.shutdown())
-        if loop:
-            loop.close()
@@ -1,6 +1,8 @@
 import aiohttp  # 비동기 HTTP 요청을 보내기 위한 라이브러리입니다. requests 대신 사용되며, 네트워크 요청을 기다리지 않고 다른 작업을 처리할 수 있습니다.
 import logging
 
+import orjson
+
 from config import WebhookConfig
 from schema.webhook_event import *
 
@@ -23,12 +25,32 @@ class AsyncWebhookManager:
             Error: "/error"
         }
         self.default_path = self.path_mapping[Error]
+        # 요청마다 문자열 결합, 헤더/타임아웃 객체 생성을 반복하지 않도록 미리 생성
+        self.url_mapping = {
+            event_type: self.endpoint + path for event_type, path in self.path_mapping.items()
+        }
+        self.default_url = self.endpoint + self.default_path
+        self.headers = {'Content-Type': 'application/json'}
+        self.timeout = aiohttp.ClientTimeout(total=10)
 
     async def initialize(self):
         """
         클래스 초기화 메서드. 비동기 HTTP 요청을 처리하기 위한 aiohttp 세션을 초기화.
+        웹훅 수신 서버와의 연결을 재사용(keep-alive)하도록 커넥터의 연결 풀 크기와 유지 시간을 명시적으로 설정.
+        세션은 워커 프로세스 수명 동안 여러 작업이 공유하므로, 작업 사이의 유휴 구간에도 연결이 유지되도록 유지 시간을 길게 설정.
         """
-        self.session = aiohttp.ClientSession()
+        connector = aiohttp.TCPConnector(
+            limit=0,                # 전체 동시 연결 수는 제한하지 않음 (웹훅 수신 서버가 단일 호스트이므로 호스트당 상한으로 제한)
+            limit_per_host=32,      # 웹훅 수신 서버(단일 호스트)당 동시 연결 수 상한
+            keepalive_timeout=60,   # 유휴 연결 유지 시간(초)
+            ttl_dns_cache=300       # DNS 조회 결과 캐싱 시간(초)
+        )
+        # 모든 요청에 공통인 헤더와 타임아웃은 요청마다 전달하지 않고 세션 기본값으로 설정
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=self.timeout
+        )
 
     async def shutdown(self):
         """
@@ -47,16 +69,15 @@ class AsyncWebhookManager:
         주어진 이벤트 타입에 따라 적절한 엔드포인트로 POST 요청을 보내고,
         성공 시 HTTP 상태 코드(200~299), 실패 시 에러 코드를 반환합니다.
         """
-        url = self.endpoint + self.path_mapping.get(type(event), self.default_path)
+        url = self.url_mapping.get(type(event), self.default_url)
 
         try:
             # aiohttp로 비동기 POST 요청
             # async with 구문은 요청이 끝나면 자동으로 리소스를 정리
             async with self.session.post(
                 url,
-                json=event.as_dict(),
-                headers={'Content-Type': 'application/json'},
-                timeout=aiohttp.ClientTimeout(total=10)
+                # aiohttp 기본 직렬화(json.dumps 후 인코딩) 대신 orjson으로 bytes 본문을 직접 생성
+                data=orjson.dumps(event.as_dict())
             ) as response:
                 # 응답이 성공(200~299)인지 확인. 실패하면 예외 발생
                 response.raise_for_status()